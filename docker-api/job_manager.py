@@ -13,15 +13,20 @@
 # limitations under the License.
 
 import os
-import json
+import shutil
 import uuid
 import subprocess
 import time
 import logging
 import re
+import shlex
+import sqlite3
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+import orjson
 
 # Configure logging
 logging.basicConfig(
@@ -34,30 +39,226 @@ logger = logging.getLogger(__name__)
 JOBS_DIR = Path("jobs")
 JOBS_DIR.mkdir(exist_ok=True)
 
+# Job metadata index; logs stay in <job_id>.log next to it
+JOBS_DB = JOBS_DIR / "jobs.db"
+
+# Pattern used to scrape training progress from the log
+_PROGRESS_RE = re.compile(r"Step\s+(\d+)/(\d+)")
+
+# Only the end of the log is scanned for progress; the latest step is almost
+# always within this many characters of the end
+_PROGRESS_TAIL_CHARS = 4096
+
+# Most bytes of an unterminated line carried over to the next log read; a step
+# line is far shorter, anything longer is not worth rescanning
+_MAX_PARTIAL_LINE = 4096
+
+# Log lines returned with a job by default and at most, and the block size
+# used when reading them backwards from the end of the log
+DEFAULT_LOG_TAIL_LINES = 200
+MAX_LOG_TAIL_LINES = 10000
+_LOG_READ_BLOCK = 8192
+
+# Seconds between log reads for a running job, depending on how recently it
+# produced output: hot jobs wrote something on the last read, warm jobs within
+# _COLD_AFTER seconds, cold jobs have been quiet for longer
+_HOT_INTERVAL = 1
+_WARM_INTERVAL = 5
+_COLD_INTERVAL = 30
+_COLD_AFTER = 60
+
+# Seconds between tmux session checks; completion itself is signalled through
+# `tmux wait-for`, so this only catches sessions that were killed
+_HEARTBEAT_INTERVAL = 30
+
+# tmux wait-for channel every job signals when its command exits
+_DONE_CHANNEL = "lerobot_done"
+
+# Finished jobs kept in memory, least recently used evicted first; running
+# jobs are always kept
+_MAX_CACHED_JOBS = 256
+
+# Whether tmux is on the PATH, looked up once without spawning it
+_TMUX_AVAILABLE = shutil.which("tmux") is not None
+
+# Seconds a `tmux list-sessions` snapshot is reused before being refreshed
+_SESSION_CACHE_TTL = 2.5
+
+# Training entry point and the (flag, param key, default) of each argument
+# passed to it from the job parameters
+_TRAIN_CMD_PREFIX = ("python", "lerobot/lerobot", "-m", "lerobot.scripts.train")
+_TRAIN_ARGS = (
+    ("policy.path", "policy_path", "lerobot/smolvla_base"),
+    ("dataset.repo_id", "dataset_repo_id", None),
+    ("batch_size", "batch_size", 64),
+    ("steps", "steps", 20000),
+    ("output_dir", "output_dir", "outputs/train/my_smolvla"),
+    ("job_name", "job_name", "my_smolvla_training"),
+    ("policy.device", "policy_device", "cuda"),
+)
+
+# Session the control-mode client attaches to; it only runs a silent command
+# so no pane output is streamed back to the client
+_CONTROL_SESSION = "lerobot_control"
+
+class _TmuxControlClient:
+    """Long-lived `tmux -C` client that runs tmux commands without forking."""
+    
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Start the control-mode client, creating its session if needed."""
+        self._process = subprocess.Popen(
+            ["tmux", "-C", "new-session", "-A", "-s", _CONTROL_SESSION, "sleep infinity"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+
+    def _read_reply(self) -> Tuple[bool, str]:
+        """Read the %begin/%end block answering the last command."""
+        output = []
+        in_block = False
+        while True:
+            line = self._process.stdout.readline()
+            if not line:
+                raise RuntimeError("tmux control client disconnected")
+            line = line.rstrip("\n")
+            if line.startswith("%exit"):
+                raise RuntimeError("tmux control client exited")
+            if not in_block:
+                # Skip notifications and the reply to the attach itself; blocks
+                # for commands sent by this client are flagged with 1
+                in_block = line.startswith("%begin ") and line.endswith(" 1")
+            elif line.startswith(("%end ", "%error ")):
+                return line.startswith("%end "), "\n".join(output)
+            elif line.startswith("%begin "):
+                # Replies can no longer be matched to commands; the caller
+                # drops this client and reconnects
+                raise RuntimeError("unexpected tmux control reply")
+            else:
+                output.append(line)
+
+    def run(self, args: List[str]) -> Tuple[bool, str]:
+        """Run a tmux command, returning whether it succeeded and its output.
+        
+        Failing to reach tmux at all, e.g. when it is not installed, is
+        reported as a failed command rather than raised. Each command is sent
+        as one line and answered by one reply, so arguments may not contain
+        line breaks; tmux would run the rest of the line as another command.
+        """
+        if any("\n" in arg or "\r" in arg for arg in args):
+            return False, "tmux arguments may not contain line breaks"
+        
+        with self._lock:
+            try:
+                if self._process is None or self._process.poll() is not None:
+                    self._connect()
+                self._process.stdin.write(" ".join(shlex.quote(arg) for arg in args) + "\n")
+                self._process.stdin.flush()
+                return self._read_reply()
+            except (OSError, RuntimeError) as e:
+                # Reconnect on the next command
+                if self._process is not None:
+                    self._process.kill()
+                    self._process = None
+                return False, str(e)
+
 class JobManager:
     def __init__(self):
         """Initialize the job manager."""
         # Ensure tmux is installed
-        try:
-            subprocess.run(["tmux", "-V"], check=True, capture_output=True)
-        except (subprocess.SubprocessError, FileNotFoundError):
+        if not _TMUX_AVAILABLE:
             logger.warning("tmux is not installed. Job persistence may not work correctly.")
         
-        # Load existing jobs from disk
-        self.jobs = {}
-        self._load_existing_jobs()
+        # Jobs held in memory in least recently used order, including every
+        # running job
+        self.jobs = OrderedDict()
+        self._jobs_lock = threading.Lock()
+        # Status fields last written per job, used to skip redundant writes
+        self._last_saved = {}
+        # One connection shared by the request handlers and the supervisor thread
+        self._db = sqlite3.connect(JOBS_DB, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db_lock = threading.Lock()
+        self._db.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            progress REAL,
+            start_time TEXT NOT NULL,
+            params_json TEXT NOT NULL,
+            error TEXT
+        )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_jobs_start_time ON jobs (start_time)")
+        # Live tmux session names, shared by all jobs and refreshed at most
+        # once per _SESSION_CACHE_TTL
+        self._sessions = set()
+        self._sessions_time = None
+        self._sessions_lock = threading.Lock()
+        # Connection used for every tmux command except blocking waits
+        self._tmux = _TmuxControlClient()
+        # Running jobs watched by the supervisor thread, keyed by job ID
+        self._active_jobs = {}
+        self._active_lock = threading.Lock()
+        self._supervisor = None
+        self._waiter = None
+        # Set to make the supervisor poll every job immediately
+        self._wake = threading.Event()
 
-    def _load_existing_jobs(self):
-        """Load existing jobs from disk."""
-        for job_file in JOBS_DIR.glob("*.json"):
-            try:
-                with open(job_file, "r") as f:
-                    job_data = json.load(f)
-                    job_id = job_data.get("job_id")
-                    if job_id:
-                        self.jobs[job_id] = job_data
-            except Exception as e:
-                logger.error(f"Error loading job file {job_file}: {str(e)}")
+    @staticmethod
+    def _row_to_job_data(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a jobs table row to the job data structure."""
+        job_data = {
+            "job_id": row["id"],
+            "status": row["status"],
+            "start_time": row["start_time"],
+            "params": orjson.loads(row["params_json"]),
+            "progress": row["progress"],
+            "log_path": str(JOBS_DIR / f"{row['id']}.log"),
+        }
+        if row["error"] is not None:
+            job_data["error"] = row["error"]
+        return job_data
+
+    def _read_log_tail(self, log_path: str, max_lines: int) -> List[str]:
+        """Read the last max_lines lines of a log file."""
+        if max_lines <= 0:
+            return []
+        try:
+            with open(log_path, "rb") as f:
+                pos = os.stat(f.fileno()).st_size
+                blocks = []
+                newlines = 0
+                # Read backwards until the first of the wanted lines is complete
+                while pos > 0 and newlines <= max_lines:
+                    step = min(_LOG_READ_BLOCK, pos)
+                    pos -= step
+                    f.seek(pos)
+                    block = f.read(step)
+                    blocks.append(block)
+                    newlines += block.count(b"\n")
+        except FileNotFoundError:
+            return []
+        
+        data = b"".join(reversed(blocks))
+        return data.decode(errors="replace").splitlines()[-max_lines:]
+
+    def _cache_job(self, job_id: str, job_data: Dict[str, Any]):
+        """Store job data in memory, evicting the least recently used finished jobs."""
+        with self._jobs_lock:
+            self.jobs[job_id] = job_data
+            self.jobs.move_to_end(job_id)
+            if len(self.jobs) > _MAX_CACHED_JOBS:
+                evictable = [jid for jid in self.jobs if jid not in self._active_jobs]
+                for jid in evictable[:len(self.jobs) - _MAX_CACHED_JOBS]:
+                    del self.jobs[jid]
+                    self._last_saved.pop(jid, None)
 
     def _create_job_data(self, job_id: str, params: Dict[str, Any], status: str = "starting") -> Dict[str, Any]:
         """Create initial job data structure."""
@@ -67,15 +268,30 @@ class JobManager:
             "start_time": datetime.now().isoformat(),
             "params": params,
             "progress": 0,
-            "logs": [],
+            "log_path": str(JOBS_DIR / f"{job_id}.log"),
         }
 
     def _save_job_data(self, job_id: str, job_data: Dict[str, Any]):
-        """Save job data to disk."""
-        job_file = JOBS_DIR / f"{job_id}.json"
-        with open(job_file, "w") as f:
-            json.dump(job_data, f, indent=2)
-        self.jobs[job_id] = job_data
+        """Save job data to the jobs table.
+        
+        The row is only rewritten when the status, whole-percent progress or
+        error changed. Logs are not stored; they live in the job's log file.
+        The in-memory copy is always updated.
+        """
+        self._cache_job(job_id, job_data)
+        
+        status_key = (job_data["status"], int(job_data.get("progress") or 0), job_data.get("error"))
+        if self._last_saved.get(job_id) == status_key:
+            return
+        
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO jobs (id, status, progress, start_time, params_json, error) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, job_data["status"], job_data.get("progress"), job_data["start_time"],
+                 orjson.dumps(job_data["params"]).decode(), job_data.get("error"))
+            )
+        self._last_saved[job_id] = status_key
 
     def _update_job_status(self, job_id: str, status: str, error: Optional[str] = None):
         """Update job status."""
@@ -86,15 +302,56 @@ class JobManager:
                 job_data["error"] = error
             self._save_job_data(job_id, job_data)
 
+    def _tmux_cmd(self, args: List[str], check: bool = True) -> str:
+        """Run a tmux command through the control-mode client.
+        
+        Returns the command's output. A failing command raises RuntimeError
+        when check is set, and otherwise returns an empty string.
+        """
+        ok, output = self._tmux.run(args)
+        if not ok:
+            if check:
+                raise RuntimeError(f"tmux {args[0]} failed: {output}")
+            return ""
+        return output
+
+    def session_exists(self, session_name: str, refresh: bool = False) -> Optional[bool]:
+        """Check whether a tmux session exists, using a shared session list.
+        
+        Returns None if the session list could not be fetched, in which case
+        the previous snapshot is kept and fetched again on the next call.
+        """
+        with self._sessions_lock:
+            now = time.monotonic()
+            if refresh or self._sessions_time is None or now - self._sessions_time >= _SESSION_CACHE_TTL:
+                ok, output = self._tmux.run(["list-sessions", "-F", "#{session_name}"])
+                if ok:
+                    self._sessions = set(output.split())
+                elif "no server running" in output:
+                    self._sessions = set()
+                else:
+                    logger.warning(f"Could not list tmux sessions: {output}")
+                    return None
+                self._sessions_time = now
+            return session_name in self._sessions
+
     def _parse_progress(self, log_content: str) -> Optional[float]:
         """Parse training progress from log content."""
-        # Look for patterns like "Step 1000/20000" or similar
-        progress_pattern = r"Step\s+(\d+)/(\d+)"
-        matches = re.findall(progress_pattern, log_content)
+        # Cheap substring check before running the regex
+        if "Step" not in log_content:
+            return None
         
-        if matches:
-            # Get the last match
-            current_step, total_steps = matches[-1]
+        # Look for patterns like "Step 1000/20000" in the tail of the log,
+        # falling back to the whole log if the tail has none
+        match = None
+        for match in _PROGRESS_RE.finditer(log_content[-_PROGRESS_TAIL_CHARS:]):
+            pass
+        if match is None and len(log_content) > _PROGRESS_TAIL_CHARS:
+            for match in _PROGRESS_RE.finditer(log_content):
+                pass
+        
+        if match:
+            current_step, total_steps = match.groups()
             try:
                 return (int(current_step) / int(total_steps)) * 100
             except (ValueError, ZeroDivisionError):
@@ -107,154 +364,270 @@ class JobManager:
         job_id = str(uuid.uuid4())
         session_name = f"lerobot_job_{job_id[:8]}"
         log_file = JOBS_DIR / f"{job_id}.log"
+        exit_file = JOBS_DIR / f"{job_id}.exit"
+        script_file = JOBS_DIR / f"{job_id}.sh"
         
         # Create initial job data
         job_data = self._create_job_data(job_id, params)
         self._save_job_data(job_id, job_data)
         
         # Build command for the training script
-        cmd = [
-            "python", "lerobot/lerobot", "-m", "lerobot.scripts.train",
-            f"--policy.path={params.get('policy_path', 'lerobot/smolvla_base')}",
-            f"--dataset.repo_id={params.get('dataset_repo_id')}",
-            f"--batch_size={params.get('batch_size', 64)}",
-            f"--steps={params.get('steps', 20000)}",
-            f"--output_dir={params.get('output_dir', 'outputs/train/my_smolvla')}",
-            f"--job_name={params.get('job_name', 'my_smolvla_training')}",
-            f"--policy.device={params.get('policy_device', 'cuda')}",
-            f"--wandb.enable={'true' if params.get('wandb_enable', True) else 'false'}"
-        ]
+        cmd = list(_TRAIN_CMD_PREFIX)
+        for flag, key, default in _TRAIN_ARGS:
+            cmd.append(f"--{flag}={params.get(key, default)}")
+        cmd.append(f"--wandb.enable={'true' if params.get('wandb_enable', True) else 'false'}")
         
         # Add additional arguments if provided
         if params.get('additional_args'):
             for key, value in params['additional_args'].items():
                 cmd.append(f"--{key}={value}")
         
-        # Create the command string for tmux
-        cmd_str = " ".join(cmd)
+        # Create the command string for the job script
+        cmd_str = shlex.join(cmd)
         
         try:
-            # Create a new tmux session
+            # Write the job's script. It waits on a start channel until its
+            # output is piped into the log, runs the training command, writes
+            # the exit code to the exit file and wakes the supervisor through
+            # the done channel. Paths are absolute since the command runs from
+            # /app. Keeping the command in a file means job parameters never
+            # end up in a tmux command line.
+            start_channel = f"lerobot_start_{job_id}"
+            exit_path = shlex.quote(str(exit_file.resolve()))
+            script_file.write_text(
+                f"tmux wait-for {start_channel}\n"
+                f"cd /app && {cmd_str}\n"
+                f"echo $? > {exit_path}.tmp\n"
+                f"mv {exit_path}.tmp {exit_path}\n"
+                f"tmux wait-for -S {_DONE_CHANNEL}\n"
+            )
+            
+            # Create a new tmux session running the script
             create_session_cmd = [
-                "tmux", "new-session", 
+                "new-session", 
                 "-d",  # Detached
                 "-s", session_name,  # Session name
-                f"cd /app && {cmd_str} | tee {log_file} ; echo 'Job completed with exit code $?' >> {log_file}"
+                f"sh {shlex.quote(str(script_file.resolve()))}"
             ]
             
-            subprocess.run(create_session_cmd, check=True)
+            self._tmux_cmd(create_session_cmd)
+            
+            # Append everything the pane prints to the log, then let it start
+            pipe_pane_cmd = ["pipe-pane", "-o", "-t", session_name, f"cat >> {log_file.resolve()}"]
+            self._tmux_cmd(pipe_pane_cmd)
+            self._tmux_cmd(["wait-for", "-S", start_channel])
             
             # Update job status to running
             self._update_job_status(job_id, "running")
             
-            # Start a background thread to monitor the job
-            self._start_monitoring_thread(job_id, session_name, log_file)
+            # Hand the job to the supervisor thread
+            self._register_job(job_id, session_name, log_file, exit_file)
             
             return job_id
         
         except Exception as e:
             logger.error(f"Failed to start job: {str(e)}")
             self._update_job_status(job_id, "error", str(e))
+            # Don't leave a session waiting on a start signal that never comes
+            self._tmux_cmd(["kill-session", "-t", session_name], check=False)
             return job_id
 
-    def _start_monitoring_thread(self, job_id: str, session_name: str, log_file: Path):
-        """Start a thread to monitor the job."""
-        import threading
+    def _register_job(self, job_id: str, session_name: str, log_file: Path, exit_file: Path):
+        """Register a running job with the supervisor, starting it if needed."""
+        now = time.monotonic()
+        job = {
+            "session_name": session_name,
+            "log_file": log_file,
+            "exit_file": exit_file,
+            # Tail state: log handle kept open between polls and any trailing
+            # partial line not yet terminated by a newline
+            "log_handle": None,
+            "tail": b"",
+            "next_poll": now,
+            "last_output": now,
+            "last_heartbeat": now,
+        }
+        
+        with self._active_lock:
+            self._active_jobs[job_id] = job
+            if self._supervisor is None or not self._supervisor.is_alive():
+                self._supervisor = threading.Thread(target=self._supervise, daemon=True)
+                self._supervisor.start()
+            if self._waiter is None or not self._waiter.is_alive():
+                self._waiter = threading.Thread(target=self._wait_for_done, daemon=True)
+                self._waiter.start()
+
+    def _wait_for_done(self):
+        """Wake the supervisor whenever a job signals the done channel."""
+        # This blocks until signalled, so it runs as its own tmux client rather
+        # than holding up the shared control-mode connection
+        while True:
+            # Exit under the lock, like the supervisor, so a job registered
+            # meanwhile starts a new waiter instead of relying on this one
+            with self._active_lock:
+                if not self._active_jobs:
+                    self._waiter = None
+                    return
+            result = subprocess.run(
+                ["tmux", "wait-for", _DONE_CHANNEL],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
+            if result.returncode != 0:
+                # No tmux server; the supervisor's heartbeat handles the jobs
+                time.sleep(_WARM_INTERVAL)
+            self._wake.set()
+
+    def _supervise(self):
+        """Poll all running jobs from a single thread until none are left."""
+        while True:
+            with self._active_lock:
+                if not self._active_jobs:
+                    self._supervisor = None
+                    return
+                active = list(self._active_jobs.items())
+            
+            woken = self._wake.is_set()
+            self._wake.clear()
+            now = time.monotonic()
+            
+            for job_id, job in active:
+                if not woken and now < job["next_poll"]:
+                    continue
+                try:
+                    finished = self._poll_job(job_id, job)
+                except Exception as e:
+                    logger.error(f"Error monitoring job {job_id}: {str(e)}")
+                    if job_id in self.jobs:
+                        self._update_job_status(job_id, "error", str(e))
+                    finished = True
+                if finished:
+                    with self._active_lock:
+                        self._active_jobs.pop(job_id, None)
+                    if job["log_handle"] is not None:
+                        job["log_handle"].close()
+            
+            # Sleep until the next job is due or a job signals completion
+            with self._active_lock:
+                next_poll = min((job["next_poll"] for job in self._active_jobs.values()), default=None)
+            if next_poll is not None:
+                self._wake.wait(max(0, next_poll - time.monotonic()))
+
+    def _poll_job(self, job_id: str, job: Dict[str, Any]) -> bool:
+        """Read new log output for a job and update its status.
+        
+        Returns True once the job no longer needs monitoring.
+        """
+        now = time.monotonic()
+        
+        # Read whatever was appended to the log since the last poll
+        if job["log_handle"] is None and job["log_file"].exists():
+            job["log_handle"] = open(job["log_file"], "rb")
+        if job["log_handle"] is not None:
+            chunk = job["log_handle"].read()
+            
+            if chunk:
+                job["last_output"] = now
+            
+            # Scan only complete lines of the new output, including the
+            # partial line left over from the previous read, so a half-written
+            # step is never parsed. Progress bars redraw with a bare \r, so it
+            # ends a line too.
+            data = job["tail"] + chunk
+            end = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+            job["tail"] = data[end:][-_MAX_PARTIAL_LINE:]
+            log_content = data[:end].decode(errors="replace")
+            
+            # Parse progress, skipping the regex when no step is logged
+            progress = self._parse_progress(log_content) if "Step" in log_content else None
+            
+            # Update job data
+            if progress is not None and job_id in self.jobs:
+                job_data = self.jobs[job_id]
+                job_data["progress"] = progress
+                self._save_job_data(job_id, job_data)
         
-        def monitor_job():
+        if job_id not in self.jobs:
+            return True
+        job_data = self.jobs[job_id]
+        
+        # Stop monitoring if the job was cancelled meanwhile
+        if job_data["status"] in ["completed", "failed", "cancelled"]:
+            return True
+        
+        # The exit file is written as soon as the training command returns
+        exit_file = job["exit_file"]
+        if exit_file.exists():
             try:
-                while True:
-                    # Check if tmux session still exists
-                    check_session_cmd = ["tmux", "has-session", "-t", session_name]
-                    session_exists = subprocess.run(
-                        check_session_cmd, 
-                        capture_output=True, 
-                        check=False
-                    ).returncode == 0
-                    
-                    # Read logs
-                    if log_file.exists():
-                        with open(log_file, "r") as f:
-                            log_content = f.read()
-                        
-                        # Parse progress
-                        progress = self._parse_progress(log_content)
-                        
-                        # Update job data
-                        if job_id in self.jobs:
-                            job_data = self.jobs[job_id]
-                            job_data["logs"] = log_content.splitlines()
-                            if progress is not None:
-                                job_data["progress"] = progress
-                            
-                            # Check for completion message
-                            if "Job completed with exit code" in log_content:
-                                exit_code_match = re.search(r"Job completed with exit code (\d+)", log_content)
-                                if exit_code_match:
-                                    exit_code = int(exit_code_match.group(1))
-                                    if exit_code == 0:
-                                        job_data["status"] = "completed"
-                                    else:
-                                        job_data["status"] = "failed"
-                                        job_data["error"] = f"Process exited with code {exit_code}"
-                                else:
-                                    job_data["status"] = "completed"
-                            
-                            self._save_job_data(job_id, job_data)
-                    
-                    # If session doesn't exist and job isn't marked as completed/failed, mark as failed
-                    if not session_exists and job_id in self.jobs:
-                        job_data = self.jobs[job_id]
-                        if job_data["status"] not in ["completed", "failed", "cancelled"]:
-                            job_data["status"] = "failed"
-                            job_data["error"] = "tmux session ended unexpectedly"
-                            self._save_job_data(job_id, job_data)
-                            break
-                    
-                    # If job is completed or failed, stop monitoring
-                    if job_id in self.jobs and self.jobs[job_id]["status"] in ["completed", "failed", "cancelled"]:
-                        break
-                    
-                    # Sleep to avoid CPU overuse
-                    time.sleep(5)
+                exit_code = int(exit_file.read_text().strip())
+            except (OSError, ValueError):
+                exit_code = None
             
-            except Exception as e:
-                logger.error(f"Error monitoring job {job_id}: {str(e)}")
-                if job_id in self.jobs:
-                    self._update_job_status(job_id, "error", str(e))
+            if exit_code == 0:
+                job_data["status"] = "completed"
+            else:
+                job_data["status"] = "failed"
+                job_data["error"] = f"Process exited with code {exit_code}"
+            self._save_job_data(job_id, job_data)
+            return True
+        
+        # Periodically make sure the session was not killed from outside
+        if now - job["last_heartbeat"] >= _HEARTBEAT_INTERVAL:
+            job["last_heartbeat"] = now
+            # An unknown answer (None) is not taken as the session being gone
+            if self.session_exists(job["session_name"]) is False and not exit_file.exists():
+                job_data["status"] = "failed"
+                job_data["error"] = "tmux session ended unexpectedly"
+                self._save_job_data(job_id, job_data)
+                return True
         
-        # Start the monitoring thread
-        thread = threading.Thread(target=monitor_job, daemon=True)
-        thread.start()
+        # Schedule the next poll based on how recently the job wrote output
+        if job["last_output"] == now:
+            job["next_poll"] = now + _HOT_INTERVAL
+        elif now - job["last_output"] < _COLD_AFTER:
+            job["next_poll"] = now + _WARM_INTERVAL
+        else:
+            job["next_poll"] = now + _COLD_INTERVAL
+        return False
 
-    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get job data by ID."""
+    def _get_job_data(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get job data by ID, without logs."""
         # First check memory
-        if job_id in self.jobs:
-            return self.jobs[job_id]
+        with self._jobs_lock:
+            if job_id in self.jobs:
+                self.jobs.move_to_end(job_id)
+                return self.jobs[job_id]
         
-        # Then check disk
-        job_file = JOBS_DIR / f"{job_id}.json"
-        if job_file.exists():
-            try:
-                with open(job_file, "r") as f:
-                    job_data = json.load(f)
-                    self.jobs[job_id] = job_data
-                    return job_data
-            except Exception as e:
-                logger.error(f"Error reading job file {job_file}: {str(e)}")
+        # Then check the database
+        try:
+            with self._db_lock:
+                row = self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row:
+                job_data = self._row_to_job_data(row)
+                self._cache_job(job_id, job_data)
+                return job_data
+        except Exception as e:
+            logger.error(f"Error reading job {job_id}: {str(e)}")
         
         return None
 
+    def get_job(self, job_id: str, tail: int = DEFAULT_LOG_TAIL_LINES) -> Optional[Dict[str, Any]]:
+        """Get job data by ID, with the last `tail` lines of its log."""
+        job_data = self._get_job_data(job_id)
+        if not job_data:
+            return None
+        return {**job_data, "logs": self._read_log_tail(job_data["log_path"], tail)}
+
     def list_jobs(self) -> List[Dict[str, Any]]:
-        """List all jobs."""
-        # Refresh job list from disk
-        self._load_existing_jobs()
-        return list(self.jobs.values())
+        """List all jobs, without their logs."""
+        with self._db_lock:
+            rows = self._db.execute("SELECT * FROM jobs ORDER BY start_time").fetchall()
+        return [self._row_to_job_data(row) for row in rows]
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job."""
-        job_data = self.get_job(job_id)
+        job_data = self._get_job_data(job_id)
         if not job_data:
             return False
         
@@ -265,21 +638,20 @@ class JobManager:
         session_name = f"lerobot_job_{job_id[:8]}"
         
         try:
-            # Check if session exists
-            check_session_cmd = ["tmux", "has-session", "-t", session_name]
-            session_exists = subprocess.run(
-                check_session_cmd, 
-                capture_output=True, 
-                check=False
-            ).returncode == 0
-            
-            if session_exists:
-                # Kill the session
-                kill_session_cmd = ["tmux", "kill-session", "-t", session_name]
-                subprocess.run(kill_session_cmd, check=True)
+            # Kill the session, which fails harmlessly if it is already gone.
+            # The job is only marked cancelled once the session is known to
+            # be gone, so a failed kill leaves it running and monitored.
+            kill_session_cmd = ["kill-session", "-t", session_name]
+            self._tmux_cmd(kill_session_cmd, check=False)
+            if self.session_exists(session_name, refresh=True) is not False:
+                logger.error(f"Could not kill tmux session {session_name} of job {job_id}")
+                return False
             
-            # Update job status
             self._update_job_status(job_id, "cancelled", "Job cancelled by user")
+            
+            # Wake the supervisor so it drops the job
+            self._tmux_cmd(["wait-for", "-S", _DONE_CHANNEL], check=False)
+            
             return True
         
         except Exception as e:
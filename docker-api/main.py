@@ -1,13 +1,14 @@
 import os
 from typing import Dict, List, Optional, Any
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import logging
 from datetime import datetime
 from pathlib import Path
 
 # Import the job manager
-from job_manager import job_manager
+from job_manager import job_manager, DEFAULT_LOG_TAIL_LINES, MAX_LOG_TAIL_LINES
 
 # Configure logging
 logging.basicConfig(
@@ -20,7 +21,7 @@ logger = logging.getLogger(__name__)
 JOBS_DIR = Path("jobs")
 JOBS_DIR.mkdir(exist_ok=True)
 
-app = FastAPI(title="LeRobot Training API")
+app = FastAPI(title="LeRobot Training API", default_response_class=ORJSONResponse)
 
 # Model for training job parameters
 class TrainingJobParams(BaseModel):
@@ -59,9 +60,9 @@ async def create_job(params: TrainingJobParams):
     return job_data
 
 @app.get("/jobs/{job_id}", response_model=JobStatus)
-async def get_job_status(job_id: str):
-    """Get the status of a job."""
-    job_data = job_manager.get_job(job_id)
+async def get_job_status(job_id: str, tail: int = Query(DEFAULT_LOG_TAIL_LINES, ge=0, le=MAX_LOG_TAIL_LINES)):
+    """Get the status of a job and the last `tail` lines of its log."""
+    job_data = job_manager.get_job(job_id, tail)
     
     if not job_data:
         raise HTTPException(status_code=404, detail="Job not found")
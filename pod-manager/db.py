@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 import aiosqlite
 from contextlib import asynccontextmanager
@@ -39,21 +40,45 @@ class Job(BaseModel):
     completed_at: Optional[str] = None
     error: Optional[str] = None
 
+# Connection shared for the lifetime of the process, opened by init_db
+_db: Optional[aiosqlite.Connection] = None
+# Serializes use of the shared connection so each caller's statements and
+# commit run as one unit
+_db_lock = asyncio.Lock()
+
 # Database connection context manager
 @asynccontextmanager
 async def get_db():
-    db = await aiosqlite.connect(DB_PATH)
-    db.row_factory = aiosqlite.Row
-    try:
-        yield db
-    finally:
-        await db.close()
+    global _db
+    async with _db_lock:
+        if _db is None:
+            _db = await aiosqlite.connect(DB_PATH)
+            _db.row_factory = aiosqlite.Row
+            # Page cache of about 8 MB (negative values are in KiB)
+            await _db.execute("PRAGMA cache_size=-8000")
+            # With WAL, NORMAL only syncs at checkpoints and stays consistent
+            await _db.execute("PRAGMA synchronous=NORMAL")
+            await _db.execute("PRAGMA temp_store=MEMORY")
+        yield _db
+
+async def close_db():
+    """Close the shared database connection"""
+    global _db
+    async with _db_lock:
+        if _db is not None:
+            await _db.close()
+            _db = None
 
 async def init_db():
     """Initialize the database with required tables"""
     logger.info(f"Initializing database at {DB_PATH}")
     
     async with get_db() as db:
+        # Only takes effect before the first table is created
+        await db.execute("PRAGMA page_size=4096")
+        # Persistent for the database file; readers no longer block the writer
+        await db.execute("PRAGMA journal_mode=WAL")
+        
         # Create pods table
         await db.execute("""
         CREATE TABLE IF NOT EXISTS pods (
@@ -85,5 +110,10 @@ async def init_db():
         )
         """)
         
+        # Indexes for lookups by pod and filtering by status
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_jobs_pod_id ON jobs (pod_id)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_pods_status ON pods (status)")
+        
         await db.commit()
         logger.info("Database initialized successfully")
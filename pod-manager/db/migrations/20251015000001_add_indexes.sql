@@ -0,0 +1,9 @@
+-- migrate:up
+CREATE INDEX idx_jobs_pod_id ON jobs (pod_id);
+CREATE INDEX idx_jobs_status ON jobs (status);
+CREATE INDEX idx_pods_status ON pods (status);
+
+-- migrate:down
+DROP INDEX idx_pods_status;
+DROP INDEX idx_jobs_status;
+DROP INDEX idx_jobs_pod_id;
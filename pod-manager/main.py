@@ -7,7 +7,7 @@ from pydantic import BaseModel, Field
 import socket
 from dotenv import load_dotenv
 
-from db import get_db, init_db
+from db import get_db, init_db, close_db
 from pod_manager import PodManager
 
 # Load environment variables
@@ -78,6 +78,12 @@ async def startup_event():
     """Initialize database on startup"""
     await init_db()
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the HTTP clients and database connection on shutdown"""
+    await pod_manager.aclose()
+    await close_db()
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -3,11 +3,16 @@ import json
 import socket
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+import time
+import random
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, AsyncIterator, Awaitable, Tuple, Union
 import httpx
+import ijson
+import orjson
 from datetime import datetime
 
-from db import get_db, Pod, Job
+from db import get_db
 
 # Configure logging
 logging.basicConfig(
@@ -16,11 +21,125 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of status requests run concurrently by the batch methods
+MAX_CONCURRENT_STATUS_REQUESTS = 16
+
+# Seconds a pod status or the pod list is served from memory, so bursts of
+# polling callers share a single round trip
+POD_STATUS_CACHE_TTL = 1.0
+POD_LIST_CACHE_TTL = 3.0
+
+# Seconds between sweeps of expired per-pod status and backoff entries
+POD_STATE_PRUNE_INTERVAL = 60.0
+
+# Timeout for probing a pod's API; a reachable pod answers in milliseconds
+POD_PROBE_TIMEOUT = httpx.Timeout(2.0, connect=1.0)
+
+# Seconds before re-probing a pod whose API could not be reached, doubled
+# after each further failure up to the maximum
+POD_PROBE_INITIAL_BACKOFF = 5.0
+POD_PROBE_MAX_BACKOFF = 300.0
+
+# RunPod responses worth retrying for idempotent requests, how many attempts
+# to make in total and the base of the exponential backoff between them
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_REQUEST_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+
+# Maximum number of queued database writes applied in one transaction
+DB_WRITE_BATCH_SIZE = 100
+
+# Shared read-only fallback for missing nested objects in RunPod responses
+_EMPTY_DICT: Dict[str, Any] = {}
+
+# Monotonic 100 ms bucket and the ISO timestamp formatted in it
+_TS_CACHE: Tuple[int, str] = (-1, "")
+
+def _now_iso() -> str:
+    """
+    Current time as an ISO string, reused for calls within the same 100 ms
+    
+    Returns:
+        ISO formatted timestamp
+    """
+    global _TS_CACHE
+    bucket = int(time.monotonic() * 10)
+    if bucket != _TS_CACHE[0]:
+        _TS_CACHE = (bucket, datetime.now().isoformat())
+    return _TS_CACHE[1]
+
+# SQL statements, all using named parameters
+SQL_INSERT_POD = (
+    "INSERT INTO pods (id, name, gpu_type, gpu_count, status, created_at, public_ip, cost_per_hr) "
+    "VALUES (:id, :name, :gpu_type, :gpu_count, :status, :created_at, :public_ip, :cost_per_hr)"
+)
+SQL_UPDATE_POD_STATUS = (
+    "UPDATE pods SET status = :status, public_ip = :public_ip, updated_at = :updated_at WHERE id = :id"
+)
+SQL_TERMINATE_POD = (
+    "UPDATE pods SET status = :status, terminated_at = :terminated_at WHERE id = :id"
+)
+SQL_UPSERT_JOB = (
+    "INSERT INTO jobs (id, pod_id, status, progress, created_at, updated_at) "
+    "VALUES (:id, :pod_id, :status, :progress, :created_at, :updated_at) "
+    "ON CONFLICT (id) DO UPDATE SET status = excluded.status, "
+    "progress = excluded.progress, updated_at = excluded.updated_at"
+)
+
+def _extract_endpoint(response: Dict) -> Optional[Tuple[str, int]]:
+    """
+    Get the public IP and mapped API port of a pod from its RunPod info
+    
+    Args:
+        response: RunPod pod information
+        
+    Returns:
+        (public IP, API port), or None if either is not available
+    """
+    public_ip = response.get("publicIp")
+    port = (response.get("portMappings") or _EMPTY_DICT).get("8000")
+    if not public_ip or not port:
+        return None
+    return public_ip, port
+
+
+class _AsyncByteReader:
+    """File-like adapter giving ijson an async read() over a streamed response"""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+    
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) and otherwise accepts chunks of any
+        # length; b"" signals the end of the body
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class RunPodAPIError(Exception):
+    """Error response from the RunPod API"""
+    
+    def __init__(self, status: int, body: str):
+        super().__init__(status, body)
+        self.status = status
+        self.body = body
+    
+    def __str__(self) -> str:
+        return f"API error: {self.status} - {self.body}"
+
+
 class PodManager:
     """
     Manager for RunPod pods running LeRobot training jobs
     """
     
+    # Ports exposed by every pod: the training API and SSH
+    _PORTS = ("8000/http", "22/tcp")
+    
     def __init__(self, api_key: str, docker_image: str):
         """
         Initialize the pod manager
@@ -32,10 +151,106 @@ class PodManager:
         self.api_key = api_key
         self.docker_image = docker_image
         self.api_base_url = "https://rest.runpod.io/v1"
+        # Encoded once here; the RunPod client sends these with every request.
+        # A missing key still lets the app start; RunPod then rejects requests.
         self.headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
+            "Authorization": b"Bearer " + (api_key or "").encode(),
+            "Content-Type": b"application/json"
+        }
+        
+        # Pod creation fields that are the same for every pod
+        self._payload_template = {
+            "imageName": self.docker_image,
+            "ports": list(self._PORTS),
         }
+        
+        # (public IP, API port) of running pods; these don't change while a
+        # pod stays RUNNING, so job status lookups can skip RunPod entirely
+        self._pod_endpoint_cache: Dict[str, Tuple[str, int]] = {}
+        
+        # Recent results as (monotonic fetch time, value); the locks make
+        # concurrent callers wait for one in-flight refresh instead of each
+        # starting their own, and are dropped once nobody holds or awaits them
+        self._status_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._status_locks: Dict[str, asyncio.Lock] = {}
+        self._status_lock_users: Dict[str, int] = defaultdict(int)
+        self._last_prune = time.monotonic()
+        self._pods_cache: Optional[Tuple[float, List[Dict]]] = None
+        self._pods_lock = asyncio.Lock()
+        
+        # (monotonic time of the next allowed probe, current delay) for pods
+        # whose API could not be reached
+        self._probe_backoff: Dict[str, Tuple[float, float]] = {}
+        
+        # Status writes are queued and applied in batches by a background task
+        self._db_queue: asyncio.Queue = asyncio.Queue()
+        self._db_writer_task: Optional[asyncio.Task] = None
+        
+        # Pooled clients reused across calls so connections are kept alive,
+        # one for the RunPod API and one for the pods' own APIs. RunPod speaks
+        # HTTP/2, so concurrent calls are multiplexed over a few connections;
+        # the pods' uvicorn servers only speak HTTP/1.1. httpx closes idle
+        # connections after 5s, so sockets to terminated pods don't linger.
+        self._runpod_client = httpx.AsyncClient(
+            base_url=self.api_base_url,
+            headers=self.headers,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=8),
+            timeout=10.0,
+        )
+        self._pod_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=10.0,
+        )
+    
+    async def aclose(self):
+        """Flush queued database writes and close the pooled HTTP clients"""
+        if self._db_writer_task is not None:
+            await self._db_queue.join()
+            self._db_writer_task.cancel()
+            self._db_writer_task = None
+        await self._runpod_client.aclose()
+        await self._pod_client.aclose()
+    
+    def _queue_db_write(self, sql: str, key: str, params: Dict[str, Any]):
+        """
+        Queue a database write for the background writer
+        
+        Args:
+            sql: Statement to execute
+            key: ID of the row it writes; a queued write with the same statement
+                and key is replaced rather than executed twice
+            params: Named statement parameters
+        """
+        if self._db_writer_task is None or self._db_writer_task.done():
+            self._db_writer_task = asyncio.create_task(self._db_writer())
+        self._db_queue.put_nowait((sql, key, params))
+    
+    async def _db_writer(self):
+        """Apply queued database writes, batching whatever is pending into one transaction"""
+        while True:
+            batch = [await self._db_queue.get()]
+            while len(batch) < DB_WRITE_BATCH_SIZE and not self._db_queue.empty():
+                batch.append(self._db_queue.get_nowait())
+            
+            # Keep only the latest parameters for each statement and row
+            latest = {}
+            for sql, key, params in batch:
+                latest[(sql, key)] = params
+            statements: Dict[str, List[Dict[str, Any]]] = {}
+            for (sql, _), params in latest.items():
+                statements.setdefault(sql, []).append(params)
+            
+            try:
+                async with get_db() as db:
+                    for sql, rows in statements.items():
+                        await db.executemany(sql, rows)
+                    await db.commit()
+            except Exception as e:
+                logger.error("Error writing to database: %s", e)
+            finally:
+                for _ in batch:
+                    self._db_queue.task_done()
     
     async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """
@@ -48,29 +263,52 @@ class PodManager:
             
         Returns:
             API response as a dictionary
+            
+        Raises:
+            RunPodAPIError: If RunPod returns an error status. GET and DELETE
+                requests are retried with backoff on rate limiting and server
+                errors first; POST is not, as it could create a second pod.
         """
-        url = f"{self.api_base_url}{endpoint}"
-        
-        async with httpx.AsyncClient() as client:
-            if method == "GET":
-                response = await client.get(url, headers=self.headers)
-            elif method == "POST":
-                response = await client.post(url, headers=self.headers, json=data)
-            elif method == "DELETE":
-                response = await client.delete(url, headers=self.headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-                
-            if response.status_code >= 400:
-                logger.error(f"API error: {response.status_code} - {response.text}")
-                raise Exception(f"API error: {response.status_code} - {response.text}")
-                
-            return response.json()
+        if method not in ("GET", "POST", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        # Encoded with orjson; the client already sends the JSON content type
+        content = orjson.dumps(data) if data is not None else None
+        attempts = MAX_REQUEST_ATTEMPTS if method != "POST" else 1
+        
+        for attempt in range(1, attempts + 1):
+            response = await self._runpod_client.request(method, endpoint, content=content)
+            if response.status_code < 400:
+                return orjson.loads(response.content)
+            await self._retry_or_raise(response, attempt, attempts)
+    
+    async def _retry_or_raise(self, response: httpx.Response, attempt: int, attempts: int):
+        """
+        Wait before retrying a RunPod request that returned an error status,
+        or raise if it is not worth retrying
+        
+        Args:
+            response: Error response, with its body already read
+            attempt: Number of the attempt that failed, starting at 1
+            attempts: Total number of attempts allowed
+            
+        Raises:
+            RunPodAPIError: If the status is not retryable or no attempts are left
+        """
+        if attempt == attempts or response.status_code not in RETRYABLE_STATUS_CODES:
+            logger.error("API error: %s - %s", response.status_code, response.text)
+            raise RunPodAPIError(response.status_code, response.text)
+        
+        # Exponential backoff with full jitter
+        delay = random.uniform(0, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        logger.warning("API error %s on %s %s, retrying in %.2fs",
+                       response.status_code, response.request.method, response.request.url.path, delay)
+        await asyncio.sleep(delay)
     
     async def create_pod(self, name: str, gpu_type_id: str, gpu_count: int = 1,
                          volume_in_gb: int = 50, container_disk_in_gb: int = 50,
                          interruptible: bool = False, cloud_type: str = "SECURE",
-                         env_vars: Dict[str, str] = {}) -> Dict:
+                         env_vars: Optional[Dict[str, str]] = None) -> Dict:
         """
         Create a new RunPod pod
         
@@ -88,37 +326,32 @@ class PodManager:
             Pod information
         """
         payload = {
+            **self._payload_template,
             "name": name,
-            "imageName": self.docker_image,
             "gpuCount": gpu_count,
             "volumeInGb": volume_in_gb,
             "containerDiskInGb": container_disk_in_gb,
             "gpuTypeId": gpu_type_id,
             "cloudType": cloud_type,
             "interruptible": interruptible,
-            "ports": ["8000/http", "22/tcp"],  # Expose API port and SSH
-            "env": env_vars
+            "env": env_vars or {}
         }
         
         response = await self._make_request("POST", "/pods", payload)
+        self._pods_cache = None
         
         # Save pod to database
         async with get_db() as db:
-            pod = Pod(
-                id=response["id"],
-                name=name,
-                gpu_type=gpu_type_id,
-                gpu_count=gpu_count,
-                status="STARTING",
-                created_at=datetime.now().isoformat(),
-                public_ip=response.get("publicIp"),
-                cost_per_hr=response.get("costPerHr")
-            )
-            await db.execute(
-                "INSERT INTO pods (id, name, gpu_type, gpu_count, status, created_at, public_ip, cost_per_hr) "
-                "VALUES (:id, :name, :gpu_type, :gpu_count, :status, :created_at, :public_ip, :cost_per_hr)",
-                pod.dict()
-            )
+            await db.execute(SQL_INSERT_POD, {
+                "id": response["id"],
+                "name": name,
+                "gpu_type": gpu_type_id,
+                "gpu_count": gpu_count,
+                "status": "STARTING",
+                "created_at": _now_iso(),
+                "public_ip": response.get("publicIp"),
+                "cost_per_hr": response.get("costPerHr")
+            })
             await db.commit()
         
         # Format response
@@ -142,34 +375,109 @@ class PodManager:
         Returns:
             Pod status information
         """
-        response = await self._make_request("GET", f"/pod/{pod_id}")
+        cached = self._status_cache.get(pod_id)
+        if cached and time.monotonic() - cached[0] < POD_STATUS_CACHE_TTL:
+            return dict(cached[1])
         
-        # Check if the pod's API is accessible
+        self._prune_pod_state()
+        
+        lock = self._status_locks.get(pod_id)
+        if lock is None:
+            lock = self._status_locks[pod_id] = asyncio.Lock()
+        self._status_lock_users[pod_id] += 1
+        try:
+            async with lock:
+                # Another caller may have refreshed it while we waited
+                cached = self._status_cache.get(pod_id)
+                if cached and time.monotonic() - cached[0] < POD_STATUS_CACHE_TTL:
+                    return dict(cached[1])
+                
+                pod_status, _ = await self._get_pod_status(pod_id)
+                return dict(pod_status)
+        finally:
+            self._status_lock_users[pod_id] -= 1
+            if not self._status_lock_users[pod_id]:
+                del self._status_lock_users[pod_id]
+                del self._status_locks[pod_id]
+    
+    def _prune_pod_state(self):
+        """Drop expired status and probe backoff entries, at most once per POD_STATE_PRUNE_INTERVAL"""
+        now = time.monotonic()
+        if now - self._last_prune < POD_STATE_PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        
+        self._status_cache = {
+            pod_id: entry for pod_id, entry in self._status_cache.items()
+            if now - entry[0] < POD_STATUS_CACHE_TTL
+        }
+        # A backoff long past its retry time no longer affects the next delay
+        self._probe_backoff = {
+            pod_id: entry for pod_id, entry in self._probe_backoff.items()
+            if now - entry[0] < POD_PROBE_MAX_BACKOFF
+        }
+    
+    def _forget_pod(self, pod_id: str):
+        """Drop everything cached about a pod that is gone or could not be looked up"""
+        self._pod_endpoint_cache.pop(pod_id, None)
+        self._status_cache.pop(pod_id, None)
+        self._probe_backoff.pop(pod_id, None)
+    
+    async def _get_pod_status(self, pod_id: str) -> Tuple[Dict, Dict]:
+        """
+        Get the status of a pod along with the raw RunPod pod info it was built from
+        
+        Args:
+            pod_id: ID of the pod
+            
+        Returns:
+            Pod status information and the RunPod API response
+        """
+        try:
+            response = await self._make_request("GET", f"/pod/{pod_id}")
+        except RunPodAPIError:
+            self._forget_pod(pod_id)
+            raise
+        
+        status = response.get("desiredStatus", "UNKNOWN")
+        endpoint = _extract_endpoint(response) if status == "RUNNING" else None
+        if endpoint:
+            self._pod_endpoint_cache[pod_id] = endpoint
+        else:
+            self._pod_endpoint_cache.pop(pod_id, None)
+        
+        # Check if the pod's API is accessible; only running pods can answer,
+        # and pods that recently failed to answer are skipped until their
+        # backoff expires
         api_accessible = False
         job_status = None
         
-        if response.get("publicIp") and response.get("portMappings", {}).get("8000"):
+        backoff = self._probe_backoff.get(pod_id)
+        if endpoint and (backoff is None or time.monotonic() >= backoff[0]):
             # Try to connect to the pod's API
-            api_url = f"http://{response['publicIp']}:{response['portMappings']['8000']}"
+            api_url = f"http://{endpoint[0]}:{endpoint[1]}"
             try:
-                async with httpx.AsyncClient() as client:
-                    api_response = await client.get(f"{api_url}/jobs", timeout=5.0)
-                    if api_response.status_code == 200:
-                        api_accessible = True
-                        job_status = api_response.json()
+                api_response = await self._pod_client.get(f"{api_url}/jobs", timeout=POD_PROBE_TIMEOUT)
+                self._probe_backoff.pop(pod_id, None)
+                if api_response.status_code == 200:
+                    api_accessible = True
+                    job_status = orjson.loads(api_response.content)
             except Exception as e:
-                logger.warning(f"Could not connect to pod API: {str(e)}")
+                logger.warning("Could not connect to pod API: %s", e)
+                delay = min(backoff[1] * 2, POD_PROBE_MAX_BACKOFF) if backoff else POD_PROBE_INITIAL_BACKOFF
+                self._probe_backoff[pod_id] = (time.monotonic() + delay, delay)
+        elif not endpoint:
+            self._probe_backoff.pop(pod_id, None)
         
         # Update pod status in database
-        status = response.get("desiredStatus", "UNKNOWN")
-        async with get_db() as db:
-            await db.execute(
-                "UPDATE pods SET status = ?, public_ip = ?, updated_at = ? WHERE id = ?",
-                (status, response.get("publicIp"), datetime.now().isoformat(), pod_id)
-            )
-            await db.commit()
+        self._queue_db_write(SQL_UPDATE_POD_STATUS, pod_id, {
+            "id": pod_id,
+            "status": status,
+            "public_ip": response.get("publicIp"),
+            "updated_at": _now_iso()
+        })
         
-        return {
+        pod_status = {
             "pod_id": pod_id,
             "status": status,
             "is_running": status == "RUNNING",
@@ -177,6 +485,8 @@ class PodManager:
             "job_status": job_status,
             "logs": None  # We don't have logs from the pod itself
         }
+        self._status_cache[pod_id] = (time.monotonic(), pod_status)
+        return pod_status, response
     
     async def get_job_status(self, pod_id: str, job_id: str) -> Dict:
         """
@@ -189,61 +499,54 @@ class PodManager:
         Returns:
             Job status information
         """
-        # First get the pod status to ensure it's running and get its IP
-        pod_status = await self.get_pod_status(pod_id)
-        
-        if not pod_status["api_accessible"]:
-            raise Exception("Pod API is not accessible")
-        
-        # Get pod IP and port
-        pod_info = await self._make_request("GET", f"/pod/{pod_id}")
-        pod_ip = pod_info.get("publicIp")
-        pod_port = pod_info.get("portMappings", {}).get("8000")
+        endpoint = self._pod_endpoint_cache.get(pod_id)
+        if endpoint is None:
+            # Get the pod status to ensure it's running, reusing the pod info
+            # it fetched for the IP and port
+            pod_status, pod_info = await self._get_pod_status(pod_id)
+            
+            if not pod_status["api_accessible"]:
+                raise Exception("Pod API is not accessible")
+            
+            # Get pod IP and port
+            endpoint = _extract_endpoint(pod_info)
+            if endpoint is None:
+                raise Exception("Pod IP or port not available")
         
-        if not pod_ip or not pod_port:
-            raise Exception("Pod IP or port not available")
+        pod_ip, pod_port = endpoint
         
         # Query the pod's API for job status
         api_url = f"http://{pod_ip}:{pod_port}"
-        async with httpx.AsyncClient() as client:
-            job_response = await client.get(f"{api_url}/jobs/{job_id}", timeout=10.0)
-            
-            if job_response.status_code != 200:
-                raise Exception(f"Failed to get job status: {job_response.status_code}")
-                
-            job_data = job_response.json()
-            
-            # Update job in database
-            async with get_db() as db:
-                # Check if job exists
-                job = await db.fetch_one("SELECT * FROM jobs WHERE id = ?", (job_id,))
-                
-                if not job:
-                    # Create new job record
-                    await db.execute(
-                        "INSERT INTO jobs (id, pod_id, status, progress, created_at, updated_at) "
-                        "VALUES (?, ?, ?, ?, ?, ?)",
-                        (job_id, pod_id, job_data.get("status", "UNKNOWN"), 
-                         job_data.get("progress", 0.0), datetime.now().isoformat(), 
-                         datetime.now().isoformat())
-                    )
-                else:
-                    # Update existing job
-                    await db.execute(
-                        "UPDATE jobs SET status = ?, progress = ?, updated_at = ? WHERE id = ?",
-                        (job_data.get("status", "UNKNOWN"), job_data.get("progress", 0.0),
-                         datetime.now().isoformat(), job_id)
-                    )
-                
-                await db.commit()
+        try:
+            job_response = await self._pod_client.get(f"{api_url}/jobs/{job_id}", timeout=10.0)
+        except httpx.TransportError:
+            # The pod may have stopped since its endpoint was cached
+            self._pod_endpoint_cache.pop(pod_id, None)
+            raise
+        
+        if job_response.status_code != 200:
+            raise Exception(f"Failed to get job status: {job_response.status_code}")
             
-            return {
-                "job_id": job_id,
-                "status": job_data.get("status", "UNKNOWN"),
-                "progress": job_data.get("progress"),
-                "logs": job_data.get("logs"),
-                "error": job_data.get("error")
-            }
+        job_data = orjson.loads(job_response.content)
+        
+        # Create or update the job in database
+        now_iso = _now_iso()
+        self._queue_db_write(SQL_UPSERT_JOB, job_id, {
+            "id": job_id,
+            "pod_id": pod_id,
+            "status": job_data.get("status", "UNKNOWN"),
+            "progress": job_data.get("progress", 0.0),
+            "created_at": now_iso,
+            "updated_at": now_iso
+        })
+        
+        return {
+            "job_id": job_id,
+            "status": job_data.get("status", "UNKNOWN"),
+            "progress": job_data.get("progress"),
+            "logs": job_data.get("logs"),
+            "error": job_data.get("error")
+        }
     
     async def list_pods(self) -> List[Dict]:
         """
@@ -252,22 +555,114 @@ class PodManager:
         Returns:
             List of pod information
         """
-        response = await self._make_request("GET", "/pods")
-        pods = []
-        
-        for pod_data in response.get("pods", []):
-            pods.append({
-                "pod_id": pod_data["id"],
-                "name": pod_data.get("name", "Unknown"),
-                "status": pod_data.get("desiredStatus", "UNKNOWN"),
-                "public_ip": pod_data.get("publicIp"),
-                "ports": pod_data.get("portMappings", {}),
-                "gpu_type": pod_data.get("gpu", {}).get("displayName"),
-                "cost_per_hr": pod_data.get("costPerHr")
-            })
+        cached = self._pods_cache
+        if cached and time.monotonic() - cached[0] < POD_LIST_CACHE_TTL:
+            return [dict(pod) for pod in cached[1]]
+        
+        async with self._pods_lock:
+            cached = self._pods_cache
+            if cached and time.monotonic() - cached[0] < POD_LIST_CACHE_TTL:
+                return [dict(pod) for pod in cached[1]]
+            
+            pods = [pod async for pod in self.iter_pods()]
+            self._pods_cache = (time.monotonic(), pods)
+            
+            # Pods missing from the listing are gone
+            known = self._pod_endpoint_cache.keys() | self._status_cache.keys() | self._probe_backoff.keys()
+            for pod_id in known - {pod["pod_id"] for pod in pods}:
+                self._forget_pod(pod_id)
+            return [dict(pod) for pod in pods]
+    
+    async def iter_pods(self) -> AsyncIterator[Dict]:
+        """
+        Stream all pods from RunPod, parsing the listing incrementally so
+        pods are yielded as they arrive instead of after the whole body
+        
+        Yields:
+            Pod information
+            
+        Raises:
+            RunPodAPIError: If RunPod returns an error status
+        """
+        for attempt in range(1, MAX_REQUEST_ATTEMPTS + 1):
+            async with self._runpod_client.stream("GET", "/pods") as response:
+                if response.status_code < 400:
+                    reader = _AsyncByteReader(response.aiter_bytes())
+                    async for pod_data in ijson.items_async(reader, "pods.item", use_float=True):
+                        yield {
+                            "pod_id": pod_data["id"],
+                            "name": pod_data.get("name", "Unknown"),
+                            "status": pod_data.get("desiredStatus", "UNKNOWN"),
+                            "public_ip": pod_data.get("publicIp"),
+                            "ports": pod_data.get("portMappings", {}),
+                            "gpu_type": (pod_data.get("gpu") or _EMPTY_DICT).get("displayName"),
+                            "cost_per_hr": pod_data.get("costPerHr")
+                        }
+                    return
+                
+                await response.aread()
+            
+            # Nothing has been yielded yet, so the listing can be retried
+            await self._retry_or_raise(response, attempt, MAX_REQUEST_ATTEMPTS)
+    
+    async def _gather_limited(self, coros: List[Awaitable]) -> List[Any]:
+        """
+        Run coroutines concurrently, at most MAX_CONCURRENT_STATUS_REQUESTS at a time
+        
+        Args:
+            coros: Coroutines to run
+            
+        Returns:
+            Results in the same order, with exceptions returned instead of raised
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_STATUS_REQUESTS)
+        
+        async def run(coro):
+            async with semaphore:
+                return await coro
+        
+        return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+    
+    async def list_pods_with_status(self) -> List[Dict]:
+        """
+        List all pods along with their live status, fetched concurrently
+        
+        Returns:
+            List of pod information, each with a "pod_status" entry that is
+            None if the status could not be fetched
+        """
+        pods = await self.list_pods()
+        statuses = await self._gather_limited([self.get_pod_status(pod["pod_id"]) for pod in pods])
+        
+        for pod, status in zip(pods, statuses):
+            if isinstance(status, Exception):
+                logger.warning("Could not get status of pod %s: %s", pod["pod_id"], status)
+                status = None
+            pod["pod_status"] = status
         
         return pods
     
+    async def get_job_statuses(self, jobs: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+        """
+        Get the status of several jobs concurrently
+        
+        Args:
+            jobs: (pod_id, job_id) pairs
+            
+        Returns:
+            Job status information in the same order, None where it could not be fetched
+        """
+        statuses = await self._gather_limited([self.get_job_status(pod_id, job_id) for pod_id, job_id in jobs])
+        
+        results = []
+        for (pod_id, job_id), status in zip(jobs, statuses):
+            if isinstance(status, Exception):
+                logger.warning("Could not get status of job %s on pod %s: %s", job_id, pod_id, status)
+                status = None
+            results.append(status)
+        
+        return results
+    
     async def terminate_pod(self, pod_id: str) -> bool:
         """
         Terminate a pod
@@ -279,13 +674,14 @@ class PodManager:
             True if successful
         """
         await self._make_request("DELETE", f"/pod/{pod_id}")
+        self._forget_pod(pod_id)
+        self._pods_cache = None
         
         # Update pod status in database
-        async with get_db() as db:
-            await db.execute(
-                "UPDATE pods SET status = ?, terminated_at = ? WHERE id = ?",
-                ("TERMINATED", datetime.now().isoformat(), pod_id)
-            )
-            await db.commit()
+        self._queue_db_write(SQL_TERMINATE_POD, pod_id, {
+            "id": pod_id,
+            "status": "TERMINATED",
+            "terminated_at": _now_iso()
+        })
         
         return True